@@ -8,44 +8,314 @@ This script provides a complete personal expense tracker with the following feat
 - List all expenses in a table view.
 - Generate summaries by Category and Month.
 - Create visualizations (Bar chart for category totals, Line chart for monthly trend).
-- Uses persistent storage in `expenses.json` with sample data auto-generation.
+- Uses persistent storage in `expenses.jsonl` (one JSON record per line) with sample data auto-generation.
+- Optionally stores or exports expenses as Parquet (requires `pyarrow`) for large histories.
 """
 
 # ## 📚 Imports and Setup
 import json
 import os
-from typing import List, Dict, Any, Optional
-import pandas as pd
-import matplotlib.pyplot as plt
+import re
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 from datetime import datetime
 
-DATA_FILE = "expenses.json"
+try:
+    # orjson parses and serializes several times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
 
-# ## 💾 Data Loading & Saving (JSON)
+DATA_FILE = "expenses.jsonl"
+# Older versions stored a single JSON array; it is migrated on first run
+LEGACY_DATA_FILE = "expenses.json"
+# Data files with this suffix are read and written as Parquet instead of JSON Lines
+PARQUET_SUFFIX = ".parquet"
+# Parquet stores keep records that fail validation in a JSON Lines file with
+# this suffix, since they may not fit the table's column types
+REJECTED_SUFFIX = ".rejected.jsonl"
+EXPORT_FILE = "expenses_export.jsonl"
+# Compiled once; matching is much cheaper than datetime.strptime per record.
+# Month and day ranges are checked by the pattern itself. Use fullmatch:
+# a `$` anchor would also accept a trailing newline.
+_DATE_RE = re.compile(r'\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])')
 
-def load_expenses(filename: str = DATA_FILE) -> List[Dict[str, Any]]:
-    """Loads expenses from a JSON file."""
+# ## 💾 Data Loading & Saving (JSON Lines)
+
+def _loads(text: Union[str, bytes]) -> Any:
+    """Parses a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def _dumps(obj: Any) -> str:
+    """Serializes an object to a compact JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+def load_expenses(filename: str = DATA_FILE) -> Iterator[Dict[str, Any]]:
+    """Streams expenses from a JSON Lines file (one expense per line)."""
     if not os.path.exists(filename):
-        return []
+        return
+    # Read as bytes: an append cut off inside a multi-byte character must
+    # only spoil its own line, not abort decoding of the whole file. Read
+    # errors propagate, so a partial load is never written back over the file.
+    with open(filename, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield _loads(line)
+            except ValueError:
+                # Skip a line left half-written by an interrupted append
+                # rather than discarding the whole file
+                continue
+
+def load_legacy_expenses(filename: str = LEGACY_DATA_FILE) -> Iterator[Dict[str, Any]]:
+    """Streams expenses from the old single-array JSON file.
+
+    Uses ijson when it is installed so that large files are parsed one record
+    at a time instead of being decoded into one big list first.
+    """
+    if not os.path.exists(filename):
+        return
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            return data
+        import ijson
+    except ImportError:
+        ijson = None
+    try:
+        with open(filename, 'rb') as f:
+            if ijson is not None:
+                yield from ijson.items(f, 'item', use_float=True)
+            else:
+                data = _loads(f.read())
+                if isinstance(data, list):
+                    yield from data
     except Exception:
-        # If file is corrupted or unreadable, return an empty list
-        return []
-    return []
+        return
+
+def append_expense(expense: Dict[str, Any], filename: str = DATA_FILE) -> None:
+    """Appends a single expense to the end of the JSON Lines file."""
+    prefix = ""
+    if os.path.exists(filename) and os.path.getsize(filename) > 0:
+        # A torn last line (interrupted append) has no trailing newline; start
+        # a fresh line so the new record is not glued onto the fragment
+        with open(filename, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                prefix = "\n"
+    with open(filename, 'a', encoding='utf-8') as f:
+        f.write(prefix + _dumps(expense) + "\n")
 
-def save_expenses(expenses: List[Dict[str, Any]], filename: str = DATA_FILE) -> None:
-    """Saves expenses to a JSON file."""
+def rewrite_all(expenses: List[Dict[str, Any]], filename: str = DATA_FILE) -> None:
+    """Rewrites the whole JSON Lines file (needed after an edit or delete)."""
     with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(expenses, f, indent=4, ensure_ascii=False)
+        for expense in expenses:
+            f.write(_dumps(expense) + "\n")
+
+def load_parquet(filename: str) -> List[Dict[str, Any]]:
+    """Loads expenses from a Parquet file (requires pyarrow)."""
+    import pyarrow.parquet as pq
+
+    if not os.path.exists(filename):
+        return []
+    # Read errors propagate: a damaged file must not look empty and be overwritten
+    return pq.read_table(filename).to_pylist()
+
+def save_parquet(expenses: List[Dict[str, Any]], filename: str) -> None:
+    """Writes all expenses to a Parquet file (requires pyarrow)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pylist(expenses)
+    if 'Category' in table.column_names:
+        # Dictionary-encode categories so readers get integer codes for free
+        index = table.schema.get_field_index('Category')
+        table = table.set_column(index, 'Category', table.column('Category').dictionary_encode())
+    pq.write_table(table, filename)
+
+def write_expenses_file(expenses: List[Dict[str, Any]], filename: str) -> None:
+    """Writes all expenses to `filename`, as Parquet or JSON Lines depending on its suffix.
+
+    The data is written to a temporary file, synced to disk and then renamed
+    over `filename`, so an interrupted write never leaves a truncated data
+    file behind.
+    """
+    tmp = filename + ".tmp"
+    try:
+        if filename.endswith(PARQUET_SUFFIX):
+            save_parquet(expenses, tmp)
+        else:
+            rewrite_all(expenses, tmp)
+        with open(tmp, 'rb') as f:
+            os.fsync(f.fileno())
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, filename)
+
+def is_valid_date(date: Any) -> bool:
+    """Checks that `date` is a YYYY-MM-DD string with a plausible month and day."""
+    return isinstance(date, str) and _DATE_RE.fullmatch(date) is not None
+
+def is_valid_expense(expense: Any) -> bool:
+    """Checks that a loaded record has a YYYY-MM-DD date, a category string and a numeric amount."""
+    if not isinstance(expense, dict) or not isinstance(expense.get('Category'), str):
+        return False
+    if not is_valid_date(expense.get('Date')):
+        return False
+    amount = expense.get('Amount')
+    if isinstance(amount, bool):
+        # bool is an int subclass, so float(True) would quietly give 1.0
+        return False
+    try:
+        float(amount)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+class ExpenseStore:
+    """Keeps the parsed expenses in memory so the file is only read once.
 
-def ensure_sample_data():
-    """Creates sample data if the expenses file is empty or doesn't exist."""
-    expenses = load_expenses()
-    if not expenses:
+    Expenses are held column-wise (one parallel list per field, amounts as a
+    float array) so summaries can scan a single column without per-row dict
+    lookups. Categories are interned as integer codes into `category_names`,
+    so grouping by category indexes a list instead of hashing strings.
+    `sorted_by_date` records whether the rows are in chronological order,
+    which lets the monthly summary scan contiguous runs. `version` is bumped
+    on every change so cached summaries can tell when they are stale.
+    Records that fail validation are kept untouched in `rejected` and written
+    back on every rewrite, so they are never silently dropped from disk
+    (Parquet stores write them to a `<file>.rejected.jsonl` sidecar).
+    On disk they are one JSON record per line, or a Parquet file when
+    `filename` ends in `.parquet`.
+    """
+
+    def __init__(self, filename: str = DATA_FILE):
+        self.filename = filename
+        self.use_parquet = filename.endswith(PARQUET_SUFFIX)
+        self.rejected_file = filename + REJECTED_SUFFIX if self.use_parquet else filename
+        self.dates: List[str] = []
+        self.months: List[str] = []
+        self.category_codes = array('l')
+        self.category_names: List[str] = []
+        self._category_index: Dict[str, int] = {}
+        self.amounts = array('d')
+        self.descriptions: List[str] = []
+        self.sorted_by_date = True
+        self.version = 0
+        self.summary_cache: Optional[Tuple[int, "Summary"]] = None
+        self.rejected: List[Any] = []
+        if self.use_parquet:
+            self._load(load_parquet(filename))
+            self.rejected.extend(load_expenses(self.rejected_file))
+        else:
+            self._load(load_expenses(filename))
+        if not self and not os.path.exists(filename):
+            self._load(load_legacy_expenses())
+            if self or self.rejected:
+                self.flush()
+        if self.rejected:
+            print(f"⚠️ Skipped {len(self.rejected)} invalid expense record(s); they are kept in {self.rejected_file} unchanged.")
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def _load(self, expenses: Iterable[Dict[str, Any]]) -> None:
+        # Malformed records are set aside instead of aborting the whole load
+        for expense in expenses:
+            if is_valid_expense(expense):
+                self._push(expense)
+            else:
+                self.rejected.append(expense)
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_index.get(category)
+        if code is None:
+            code = self._category_index[category] = len(self.category_names)
+            self.category_names.append(category)
+        return code
+
+    def _push(self, expense: Dict[str, Any]) -> None:
+        self.version += 1
+        if self.dates and expense['Date'] < self.dates[-1]:
+            self.sorted_by_date = False
+        self.dates.append(expense['Date'])
+        # Older records have no precomputed month; derive it from YYYY-MM-DD
+        self.months.append(expense.get('Month') or expense['Date'][:7])
+        self.category_codes.append(self._category_code(expense['Category']))
+        self.amounts.append(float(expense['Amount']))
+        self.descriptions.append(expense.get('Description', ''))
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """Returns the expense at the given index as a dict."""
+        return {"Date": self.dates[index], "Month": self.months[index], "Category": self.category_names[self.category_codes[index]],
+                "Amount": self.amounts[index], "Description": self.descriptions[index]}
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Returns all expenses as a list of dicts."""
+        return [self.record(i) for i in range(len(self))]
+
+    def append(self, expense: Dict[str, Any]) -> None:
+        """Adds one expense and appends it to disk without rewriting the file."""
+        self._push(expense)
+        if self.use_parquet:
+            # Parquet files cannot be appended to in place
+            self.flush()
+        else:
+            append_expense(self.record(len(self) - 1), self.filename)
+
+    def extend(self, expenses: Iterable[Dict[str, Any]]) -> None:
+        """Adds several expenses and writes the file once."""
+        for expense in expenses:
+            self._push(expense)
+        self.flush()
+
+    def replace(self, index: int, expense: Dict[str, Any]) -> None:
+        """Overwrites the expense at the given index (in memory only)."""
+        self.version += 1
+        self.dates[index] = expense['Date']
+        if self.sorted_by_date and not self._in_order_at(index):
+            self.sorted_by_date = False
+        self.months[index] = expense.get('Month') or expense['Date'][:7]
+        self.category_codes[index] = self._category_code(expense['Category'])
+        self.amounts[index] = float(expense['Amount'])
+        self.descriptions[index] = expense.get('Description', '')
+
+    def remove(self, index: int) -> None:
+        """Removes the expense at the given index (in memory only).
+
+        Later rows shift down by one, keeping their relative (and date) order.
+        A delete is always followed by a full rewrite, so the O(N) shift is not
+        the dominant cost.
+        """
+        self.version += 1
+        for column in (self.dates, self.months, self.category_codes, self.amounts, self.descriptions):
+            column.pop(index)
+
+    def _in_order_at(self, index: int) -> bool:
+        date = self.dates[index]
+        return ((index == 0 or self.dates[index - 1] <= date)
+                and (index + 1 >= len(self) or date <= self.dates[index + 1]))
+
+    def flush(self) -> None:
+        """Rewrites the in-memory expenses (and any rejected records) to disk."""
+        if self.use_parquet:
+            # Rejected records may not match the table's types, so keep them out of it
+            write_expenses_file(self.records(), self.filename)
+            if self.rejected:
+                write_expenses_file(self.rejected, self.rejected_file)
+        else:
+            write_expenses_file(self.records() + self.rejected, self.filename)
+
+def ensure_sample_data(store: ExpenseStore) -> None:
+    """Creates sample data if the expenses file doesn't exist yet."""
+    # An existing file is never seeded over, even if none of its records loaded
+    if not os.path.exists(store.filename):
         print("No expenses found. Creating sample data...")
         sample = [
             {"Date": "2025-10-01", "Category": "Food", "Amount": 200.0, "Description": "Breakfast"},
@@ -53,118 +323,171 @@ def ensure_sample_data():
             {"Date": "2025-10-05", "Category": "Shopping", "Amount": 500.0, "Description": "Groceries"},
             {"Date": "2025-09-28", "Category": "Bills", "Amount": 1500.0, "Description": "Electricity bill"}
         ]
-        save_expenses(sample)
-        return sample
-    return expenses
-
-# ## 🧰 DataFrame Helper
-
-def load_as_dataframe() -> pd.DataFrame:
-    """Loads expenses and returns them as a pandas DataFrame."""
-    expenses = load_expenses()
-    df = pd.DataFrame(expenses)
-    if df.empty:
-        return df
-    # Ensure correct data types
-    if 'Date' in df.columns:
-        df['Date'] = pd.to_datetime(df['Date'])
-        df['Month'] = df['Date'].dt.to_period('M')
-    if 'Amount' in df.columns:
-        df['Amount'] = pd.to_numeric(df['Amount'], errors='coerce').fillna(0.0)
-    return df
+        store.extend(sample)
 
 # ## 🔧 Core functions (add, edit, delete, list, summary, visuals)
 
-def add_expense(date: str, category: str, amount: float, description: str) -> None:
+def add_expense(store: ExpenseStore, date: str, category: str, amount: float, description: str) -> None:
     """Adds a new expense."""
-    expenses = load_expenses()
-    new_expense = {"Date": date, "Category": category, "Amount": float(amount), "Description": description}
-    expenses.append(new_expense)
-    save_expenses(expenses)
+    new_expense = {"Date": date, "Month": date[:7], "Category": category, "Amount": float(amount), "Description": description}
+    store.append(new_expense)
     print("✅ Expense added successfully.")
 
-def list_expenses() -> pd.DataFrame:
-    """Returns a DataFrame of all expenses."""
-    df = load_as_dataframe()
-    if df.empty:
-        print("No expenses to display.")
-        return df
-    # Add a RowID for easy editing/deleting
-    df_display = df.reset_index().rename(columns={'index':'RowID'})
-    return df_display
-
-def find_expense_index_by_rowid(rowid: int) -> Optional[int]:
-    """Finds the list index corresponding to a DataFrame RowID."""
-    expenses = load_expenses()
-    if 0 <= rowid < len(expenses):
+def list_expenses(store: ExpenseStore) -> str:
+    """Returns all expenses formatted as a text table."""
+    if not store:
+        return "No expenses to display."
+    lines = [f"{'RowID':<6}{'Date':<12}{'Category':<15}{'Amount':>12}  Description"]
+    # Rows can be stored out of date order (back-dated adds, edits), so show
+    # them by date; the RowID (store index) is what edit/delete expect
+    for i in sorted(range(len(store)), key=store.dates.__getitem__):
+        lines.append(f"{i:<6}{store.dates[i]:<12}{store.category_names[store.category_codes[i]]:<15}"
+                     f"{store.amounts[i]:>12.2f}  {store.descriptions[i]}")
+    return "\n".join(lines)
+
+def find_expense_index_by_rowid(store: ExpenseStore, rowid: int) -> Optional[int]:
+    """Finds the store index corresponding to a listed RowID."""
+    if 0 <= rowid < len(store):
         return rowid
     return None
 
-def edit_expense(index: int, date: str, category: str, amount: float, description: str) -> bool:
+def edit_expense(store: ExpenseStore, index: int, date: str, category: str, amount: float, description: str) -> bool:
     """Edits an existing expense by its index."""
-    expenses = load_expenses()
-    if 0 <= index < len(expenses):
-        expenses[index] = {"Date": date, "Category": category, "Amount": float(amount), "Description": description}
-        save_expenses(expenses)
+    if 0 <= index < len(store):
+        store.replace(index, {"Date": date, "Month": date[:7], "Category": category,
+                              "Amount": float(amount), "Description": description})
+        store.flush()
         return True
     return False
 
-def delete_expense(index: int) -> bool:
+def delete_expense(store: ExpenseStore, index: int) -> bool:
     """Deletes an expense by its index."""
-    expenses = load_expenses()
-    if 0 <= index < len(expenses):
-        expenses.pop(index)
-        save_expenses(expenses)
+    if 0 <= index < len(store):
+        store.remove(index)
+        store.flush()
         return True
     return False
 
-def view_summary() -> Dict[str, pd.DataFrame]:
-    """Generates summaries of expenses by category and month."""
-    df = load_as_dataframe()
-    if df.empty:
-        return {"by_category": pd.DataFrame(), "by_month": pd.DataFrame()}
-    by_category = df.groupby('Category', as_index=False)['Amount'].sum().sort_values('Amount', ascending=False)
-    by_month = df.groupby('Month', as_index=False)['Amount'].sum().sort_values('Month')
-    return {"by_category": by_category, "by_month": by_month}
+@dataclass
+class Summary:
+    """Expense totals by category, by month and overall."""
+    by_category: Dict[str, float] = field(default_factory=dict)
+    by_month: Dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+
+def view_summary(store: ExpenseStore) -> Summary:
+    """Generates summaries of expenses by category and month in a single pass.
 
-def show_visual_summary():
+    The result is cached on the store until the expenses change.
+    """
+    if store.summary_cache is not None and store.summary_cache[0] == store.version:
+        return store.summary_cache[1]
+    category_totals = [0.0] * len(store.category_names)
+    category_counts = [0] * len(store.category_names)
+    by_month: Dict[str, float] = {}
+    total = 0.0
+    # Months are summed in runs of equal keys, flushed when the key changes.
+    # Date-sorted stores have one run per month, so this avoids a dict update
+    # per row; unsorted stores just flush more often into the same dict.
+    current_month, running = None, 0.0
+    for month, code, amount in zip(store.months, store.category_codes, store.amounts):
+        category_totals[code] += amount
+        category_counts[code] += 1
+        if month != current_month:
+            if current_month is not None:
+                by_month[current_month] = by_month.get(current_month, 0.0) + running
+            current_month, running = month, 0.0
+        running += amount
+        total += amount
+    if current_month is not None:
+        by_month[current_month] = by_month.get(current_month, 0.0) + running
+    if not store.sorted_by_date:
+        by_month = dict(sorted(by_month.items()))
+    # Skip categories whose expenses have all been edited away or deleted
+    by_category = {name: category_totals[code] for code, name in enumerate(store.category_names)
+                   if category_counts[code]}
+    summary = Summary(
+        by_category=dict(sorted(by_category.items(), key=lambda kv: kv[1], reverse=True)),
+        by_month=by_month,
+        total=total,
+    )
+    store.summary_cache = (store.version, summary)
+    return summary
+
+# Figures are reused across calls instead of creating (and leaking) new ones
+_FIGS: Dict[str, Any] = {}
+
+def _get_figure(plt: Any, key: str) -> Tuple[Any, Any]:
+    """Returns a cleared (figure, axes) pair for `key`, creating it if needed."""
+    if key in _FIGS and plt.fignum_exists(_FIGS[key][0].number):
+        fig, ax = _FIGS[key]
+        ax.clear()
+    else:
+        # The figure was never created or its window has been closed
+        fig, ax = _FIGS[key] = plt.subplots(figsize=(10, 5))
+    return fig, ax
+
+def show_visual_summary(store: ExpenseStore):
     """Displays visualizations of the expense data."""
-    df = load_as_dataframe()
-    if df.empty:
+    # matplotlib is slow to import, so it is only loaded when plotting
+    import matplotlib.pyplot as plt
+
+    if not store:
         print("No data to visualize.")
         return
     
-    summary = view_summary()
-    by_category = summary['by_category']
-    by_month = summary['by_month']
+    summary = view_summary(store)
+    by_category = summary.by_category
+    by_month = summary.by_month
 
     # --- Plot 1: Expenses by Category ---
-    fig1, ax1 = plt.subplots(figsize=(10, 5))
-    ax1.bar(by_category['Category'], by_category['Amount'], color='skyblue')
+    fig1, ax1 = _get_figure(plt, 'category')
+    # Plot against positions and label the ticks, keeping matplotlib on a numeric axis
+    ax1.bar(range(len(by_category)), list(by_category.values()), color='skyblue')
+    ax1.set_xticks(range(len(by_category)), labels=list(by_category.keys()), rotation=45, ha='right')
     ax1.set_title('Total Expenses by Category')
     ax1.set_xlabel('Category')
     ax1.set_ylabel('Total Amount (₹)')
-    plt.xticks(rotation=45, ha='right')
     fig1.tight_layout()
 
     # --- Plot 2: Monthly Expense Trend ---
-    fig2, ax2 = plt.subplots(figsize=(10, 5))
-    # Convert Period objects to string for stable plotting
-    ax2.plot(by_month['Month'].astype(str), by_month['Amount'], marker='o', linestyle='-')
+    fig2, ax2 = _get_figure(plt, 'month')
+    ax2.plot(range(len(by_month)), list(by_month.values()), marker='o', linestyle='-')
+    ax2.set_xticks(range(len(by_month)), labels=list(by_month.keys()), rotation=45, ha='right')
     ax2.set_title('Monthly Expense Trend')
     ax2.set_xlabel('Month')
     ax2.set_ylabel('Total Amount (₹)')
-    plt.xticks(rotation=45, ha='right')
     fig2.tight_layout()
 
     print("Displaying plots... Close the plot windows to continue.")
     plt.show()
 
+def export_expenses(store: ExpenseStore, filename: str) -> bool:
+    """Exports all expenses to `filename` (Parquet for `.parquet`, otherwise JSON Lines)."""
+    target = os.path.abspath(filename)
+    if target in (os.path.abspath(store.filename), os.path.abspath(store.rejected_file)):
+        # Exporting only writes valid records, so this would drop rejected ones
+        print("❌ Cannot export over the tracker's own data file. Choose another name.")
+        return False
+    try:
+        write_expenses_file(store.records(), filename)
+    except ImportError:
+        print("❌ pyarrow is required for Parquet export (pip install pyarrow).")
+        return False
+    except (OSError, ValueError, TypeError) as e:
+        # OSError covers bad paths and permissions; pyarrow's ArrowInvalid and
+        # ArrowTypeError subclass ValueError and TypeError
+        print(f"❌ Export failed: {e}")
+        return False
+    print(f"✅ Exported {len(store)} expenses to {filename}.")
+    return True
+
 # ## 🧭 Command-Line Interface (CLI)
 
-def main():
+def main(filename: str = DATA_FILE):
     """Main function to run the command-line interface."""
-    ensure_sample_data()
+    store = ExpenseStore(filename)
+    ensure_sample_data(store)
 
     while True:
         print("\n--- 💰 Personal Expense Tracker ---")
@@ -174,30 +497,37 @@ def main():
         print("4. Delete Expense")
         print("5. Show Summary Tables")
         print("6. Show Visual Summary (Plots)")
-        print("7. Exit")
+        print("7. Export Expenses (JSON Lines / Parquet)")
+        print("8. Exit")
         
         choice = input("Enter your choice: ")
 
         if choice == '1':
             date = input(f"Enter date (YYYY-MM-DD) [default: {datetime.today().strftime('%Y-%m-%d')}]: ") or datetime.today().strftime('%Y-%m-%d')
+            if not is_valid_date(date):
+                print("❌ Invalid date. Please use YYYY-MM-DD.")
+                continue
             category = input("Enter category: ")
             amount = float(input("Enter amount: "))
             description = input("Enter description: ")
-            add_expense(date, category, amount, description)
+            add_expense(store, date, category, amount, description)
 
         elif choice == '2':
             print("\n--- All Expenses ---")
-            print(list_expenses())
+            print(list_expenses(store))
 
         elif choice == '3':
             row_id = int(input("Enter the RowID of the expense to edit: "))
-            index = find_expense_index_by_rowid(row_id)
+            index = find_expense_index_by_rowid(store, row_id)
             if index is not None:
                 date = input("Enter new date (YYYY-MM-DD): ")
+                if not is_valid_date(date):
+                    print("❌ Invalid date. Please use YYYY-MM-DD.")
+                    continue
                 category = input("Enter new category: ")
                 amount = float(input("Enter new amount: "))
                 description = input("Enter new description: ")
-                if edit_expense(index, date, category, amount, description):
+                if edit_expense(store, index, date, category, amount, description):
                     print(f"✅ Expense at RowID {row_id} updated.")
                 else:
                     print(f"❌ Failed to update expense at RowID {row_id}.")
@@ -206,9 +536,9 @@ def main():
 
         elif choice == '4':
             row_id = int(input("Enter the RowID of the expense to delete: "))
-            index = find_expense_index_by_rowid(row_id)
+            index = find_expense_index_by_rowid(store, row_id)
             if index is not None:
-                if delete_expense(index):
+                if delete_expense(store, index):
                     print(f"🗑️ Expense at RowID {row_id} deleted.")
                 else:
                     print(f"❌ Failed to delete expense at RowID {row_id}.")
@@ -216,16 +546,26 @@ def main():
                 print("❌ Invalid RowID.")
                 
         elif choice == '5':
-            summary = view_summary()
+            summary = view_summary(store)
             print("\n--- Summary by Category ---")
-            print(summary['by_category'])
+            for category, amount in summary.by_category.items():
+                print(f"{category:<15}{amount:>12.2f}")
             print("\n--- Summary by Month ---")
-            print(summary['by_month'])
+            for month, amount in summary.by_month.items():
+                print(f"{month:<15}{amount:>12.2f}")
+            print(f"\n{'Total':<15}{summary.total:>12.2f}")
 
         elif choice == '6':
-            show_visual_summary()
+            show_visual_summary(store)
 
         elif choice == '7':
+            filename = input(f"Enter export file name (.jsonl or .parquet) [default: {EXPORT_FILE}]: ") or EXPORT_FILE
+            export_expenses(store, filename)
+
+        elif choice == '8':
+            if _FIGS:
+                import matplotlib.pyplot as plt
+                plt.close('all')
             print("Exiting. Goodbye!")
             break
             
@@ -233,4 +573,5 @@ def main():
             print("Invalid choice. Please try again.")
 
 if __name__ == "__main__":
-    main()
+    # An optional argument selects the data file, e.g. `expenses.parquet`
+    main(sys.argv[1] if len(sys.argv) > 1 else DATA_FILE)